@@ -0,0 +1,62 @@
+"""
+Release-cohort analytics over the parsed release date pool
+"""
+from datetime import date
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
+from steam_analytics.dashboard.records import MetadataTable
+
+AGE_BINS = [-np.inf, 1, 3, 5, 10, np.inf]
+AGE_LABELS = ["1년 미만", "1~3년", "3~5년", "5~10년", "10년 이상"]
+UNKNOWN_COHORT = "알 수 없음"
+
+
+def release_dates_for(top100: List, metadata: MetadataTable) -> np.ndarray:
+    """Look up each game's parsed release date (NaT when missing or unparseable)"""
+    appids = np.array([game["appid"] for game in top100], dtype=np.int64)
+    release = np.full(len(appids), np.datetime64("NaT"), dtype="datetime64[D]")
+    if len(metadata.appids) == 0 or len(appids) == 0:
+        return release
+    rows = np.searchsorted(metadata.appids, appids)
+    rows = np.minimum(rows, len(metadata.appids) - 1)
+    found = metadata.appids[rows] == appids
+    release[found] = metadata.release_date_pool[metadata.date_codes[rows[found]]]
+    return release
+
+
+def release_cohorts(top100: List, metadata: MetadataTable, by: str = "year",
+                    today: Optional[date] = None) -> pd.DataFrame:
+    """Player share by release year (by="year") or by game age bucket (by="age")"""
+    df = pd.DataFrame({
+        "players": np.array([game.get("current_players", 0) for game in top100], dtype=np.int64),
+        "release": release_dates_for(top100, metadata),
+    })
+    if df.empty:
+        return pd.DataFrame(columns=["Cohort", "Total Players", "Game Count", "Avg Players per Game", "Player Share (%)"])
+
+    if by == "year":
+        cohort = df["release"].dt.year.astype("Int64").astype("string")
+    else:
+        age_years = (pd.Timestamp(today or date.today()) - df["release"]).dt.days / 365.25
+        cohort = pd.cut(age_years, bins=AGE_BINS, labels=AGE_LABELS, right=False).astype("string")
+    df["cohort"] = cohort.fillna(UNKNOWN_COHORT).to_numpy()
+
+    grouped = df.groupby("cohort", sort=False)["players"].agg(["sum", "count"])
+    # 연도는 오래된 순, 나이 구간은 정의된 순서, 알 수 없음은 마지막
+    order = sorted(grouped.index[grouped.index != UNKNOWN_COHORT],
+                   key=(lambda c: c) if by == "year" else AGE_LABELS.index)
+    if UNKNOWN_COHORT in grouped.index:
+        order.append(UNKNOWN_COHORT)
+    grouped = grouped.loc[order]
+
+    total_players = grouped["sum"].sum()
+    return pd.DataFrame({
+        "Cohort": grouped.index,
+        "Total Players": grouped["sum"].to_numpy(),
+        "Game Count": grouped["count"].to_numpy(),
+        "Avg Players per Game": (grouped["sum"] / grouped["count"]).round(1).to_numpy(),
+        "Player Share (%)": (grouped["sum"] / total_players * 100 if total_players else grouped["sum"] * 0.0).round(1).to_numpy(),
+    })
@@ -0,0 +1,71 @@
+"""
+Genre x category co-occurrence analytics on a boolean-matrix encoding
+"""
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+def encode_tags(top100: List[Dict], metadata: Dict, field: str) -> Tuple[np.ndarray, List[str]]:
+    """Encode each game's genres/categories as a (games x tags) boolean matrix"""
+    # 게임별 태그 목록 수집 (메타데이터가 없으면 빈 목록)
+    tag_lists = []
+    for game in top100:
+        appid = game["appid"]
+        meta = metadata.get(str(appid)) or metadata.get(appid) or {}
+        tag_lists.append(meta.get(field, []))
+
+    tags = sorted({tag for tag_list in tag_lists for tag in tag_list})
+    tag_index = {tag: i for i, tag in enumerate(tags)}
+
+    # 한 번에 좌표를 모아 행렬을 채움
+    rows = [i for i, tag_list in enumerate(tag_lists) for _ in tag_list]
+    cols = [tag_index[tag] for tag_list in tag_lists for tag in tag_list]
+    matrix = np.zeros((len(tag_lists), len(tags)), dtype=bool)
+    matrix[rows, cols] = True
+    return matrix, tags
+
+
+def build_cooccurrence(top100: List[Dict], metadata: Dict) -> Dict:
+    """Build player-weighted and game-count genre x category co-occurrence matrices"""
+    genre_matrix, genres = encode_tags(top100, metadata, "genres")
+    category_matrix, categories = encode_tags(top100, metadata, "categories")
+    players = np.array([game.get("current_players", 0) or 0 for game in top100], dtype=np.int64)
+
+    # (genres x games) @ (games x categories) -> 조합별 합계
+    genre_t = genre_matrix.T.astype(np.int64)
+    category_int = category_matrix.astype(np.int64)
+    player_matrix = genre_t @ (category_int * players[:, None])
+    count_matrix = genre_t @ category_int
+
+    return {
+        "players": pd.DataFrame(player_matrix, index=genres, columns=categories),
+        "games": pd.DataFrame(count_matrix, index=genres, columns=categories),
+    }
+
+
+def top_pairs(cooccurrence: Dict, n: int = 20) -> pd.DataFrame:
+    """Return the top-n genre/category pairs by player count"""
+    players = cooccurrence["players"]
+    games = cooccurrence["games"]
+    values = players.to_numpy().ravel()
+    if values.size == 0:
+        return pd.DataFrame(columns=["Genre", "Category", "Total Players", "Game Count", "Avg Players per Game"])
+
+    # 전체 정렬 대신 argpartition으로 상위 n개만 추림
+    n = min(n, values.size)
+    top_idx = np.argpartition(values, -n)[-n:]
+    top_idx = top_idx[np.argsort(values[top_idx])[::-1]]
+    top_idx = top_idx[values[top_idx] > 0]
+
+    row_idx, col_idx = np.unravel_index(top_idx, players.shape)
+    counts = games.to_numpy()[row_idx, col_idx]
+    totals = values[top_idx]
+    return pd.DataFrame({
+        "Genre": players.index[row_idx],
+        "Category": players.columns[col_idx],
+        "Total Players": totals,
+        "Game Count": counts,
+        "Avg Players per Game": np.round(totals / np.maximum(counts, 1), 1),
+    })
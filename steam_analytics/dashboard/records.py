@@ -0,0 +1,344 @@
+"""
+Compact records for top100 snapshots and game metadata.
+
+``MetadataTable`` stores a metadata file column-wise: sorted appids in a numpy
+array, names in one UTF-8 blob, and genres, categories and release dates as
+codes into pools of interned values. Each pooled release date also has a parsed
+``datetime64`` entry, taken from ``release_date_iso`` when the file has it and
+parsed from the raw string only for older files. Long text fields (``short_description``,
+``header_image``) stay in the source file; loading records the byte span of
+each game's entry, which is read back with a single seek on first access (or
+by reparsing the file if it changed since it was loaded). Rows
+are exposed as lightweight ``GameMeta`` views, and both the table and
+``TopGame`` keep the dict-style ``get``/``[]`` access the dashboard already uses.
+
+    python -m steam_analytics.dashboard.records data/raw/game_metadata_093209.json
+"""
+import json
+import os
+import re
+import sys
+import tracemalloc
+from collections.abc import Mapping
+from datetime import date
+from functools import lru_cache
+from json.decoder import scanstring
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from steam_analytics.scraper.release_dates import parse_release_date
+
+LONG_TEXT_FIELDS = ("short_description", "header_image")
+WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class _Record:
+    __slots__ = ()
+
+    def get(self, key, default=None):
+        try:
+            value = getattr(self, key)
+        except AttributeError:
+            return default
+        return default if value is None else value
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __contains__(self, key):
+        return not key.startswith("_") and hasattr(self, key)
+
+
+class TopGame(_Record):
+    __slots__ = ("rank", "appid", "current_players", "peak_in_game")
+
+    def __init__(self, rank: Optional[int], appid: int, current_players: int, peak_in_game: Optional[int]):
+        self.rank = rank
+        self.appid = appid
+        self.current_players = current_players
+        self.peak_in_game = peak_in_game
+
+    @classmethod
+    def from_dict(cls, game: Dict) -> "TopGame":
+        return cls(
+            game.get("rank"),
+            int(game["appid"]),
+            int(game.get("current_players") or 0),
+            game.get("peak_in_game"),
+        )
+
+    def __reduce__(self):
+        return (TopGame, (self.rank, self.appid, self.current_players, self.peak_in_game))
+
+
+def compact_top100(data: List[Dict]) -> List[TopGame]:
+    return [TopGame.from_dict(game) for game in data]
+
+
+def _parse_with_spans(raw: bytes) -> Tuple[Dict, Dict[str, Tuple[int, int]]]:
+    """Parse a top-level JSON object, also returning the byte span of each value"""
+    text = raw.decode("utf-8")
+    decoder = json.JSONDecoder()
+    ascii_only = len(text) == len(raw)
+    data: Dict = {}
+    spans: Dict[str, Tuple[int, int]] = {}
+    char_pos = byte_pos = 0
+
+    def byte_offset(pos: int) -> int:
+        # 문자 위치를 바이트 위치로 변환 (앞에서부터 한 번만 인코딩)
+        nonlocal char_pos, byte_pos
+        if ascii_only:
+            return pos
+        byte_pos += len(text[char_pos:pos].encode("utf-8"))
+        char_pos = pos
+        return byte_pos
+
+    pos = WHITESPACE.match(text).end()
+    if not text.startswith("{", pos):
+        raise json.JSONDecodeError("Expecting '{'", text, pos)
+    pos = WHITESPACE.match(text, pos + 1).end()
+    if text.startswith("}", pos):
+        return data, spans
+    while True:
+        if not text.startswith('"', pos):
+            raise json.JSONDecodeError("Expecting property name enclosed in double quotes", text, pos)
+        key, pos = scanstring(text, pos + 1)
+        pos = WHITESPACE.match(text, pos).end()
+        if not text.startswith(":", pos):
+            raise json.JSONDecodeError("Expecting ':' delimiter", text, pos)
+        pos = WHITESPACE.match(text, pos + 1).end()
+        data[key], end = decoder.raw_decode(text, pos)
+        spans[key] = (byte_offset(pos), byte_offset(end))
+        pos = WHITESPACE.match(text, end).end()
+        if text.startswith(",", pos):
+            pos = WHITESPACE.match(text, pos + 1).end()
+        elif text.startswith("}", pos):
+            break
+        else:
+            raise json.JSONDecodeError("Expecting ',' delimiter", text, pos)
+    pos = WHITESPACE.match(text, pos + 1).end()
+    if pos != len(text):
+        raise json.JSONDecodeError("Extra data", text, pos)
+    return data, spans
+
+
+def _file_signature(target) -> Optional[Tuple[int, int]]:
+    """(st_mtime_ns, st_size) of a path or file descriptor, None if it is gone"""
+    try:
+        stat = os.stat(target)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+@lru_cache(maxsize=256)
+def _load_long_text(source: str, signature: Optional[Tuple[int, int]], appid: str,
+                    span: Optional[Tuple[int, int]]) -> Tuple[str, ...]:
+    """Read one game's long text fields from its byte span, or by reparsing the file when span is None"""
+    try:
+        with open(source, "rb") as f:
+            if span is not None:
+                f.seek(span[0])
+                meta = json.loads(f.read(span[1] - span[0]).decode("utf-8"))
+            else:
+                data = json.loads(f.read().decode("utf-8"))
+                meta = data.get(appid) if isinstance(data, dict) else None
+    except (OSError, ValueError) as e:
+        print(f"Error reading {source}: {str(e)}")
+        meta = {}
+    if not isinstance(meta, dict):
+        meta = {}
+    return tuple(meta.get(field, "") for field in LONG_TEXT_FIELDS)
+
+
+def _release_date(raw: str, iso: Optional[str]) -> Optional[date]:
+    """Use the ingest-time ISO date if present, otherwise parse the raw string"""
+    if iso:
+        try:
+            return date.fromisoformat(iso)
+        except (TypeError, ValueError):
+            pass
+    # 풀에서 고유값마다 한 번만 호출되므로 lru_cache를 채우지 않음
+    return parse_release_date.__wrapped__(raw)
+
+
+class GameMeta(_Record):
+    """Read-only view of one MetadataTable row"""
+    __slots__ = ("_table", "_row")
+
+    def __init__(self, table: "MetadataTable", row: int):
+        self._table = table
+        self._row = row
+
+    @property
+    def appid(self) -> str:
+        return str(self._table.appids[self._row])
+
+    @property
+    def name(self) -> str:
+        offsets = self._table.name_offsets
+        return self._table.names[offsets[self._row]:offsets[self._row + 1]].decode("utf-8")
+
+    @property
+    def genres(self) -> Tuple[str, ...]:
+        return self._table.tag_pool[self._table.genre_codes[self._row]]
+
+    @property
+    def categories(self) -> Tuple[str, ...]:
+        return self._table.tag_pool[self._table.category_codes[self._row]]
+
+    @property
+    def release_date(self) -> str:
+        return self._table.date_pool[self._table.date_codes[self._row]]
+
+    @property
+    def price(self) -> float:
+        return float(self._table.prices[self._row])
+
+    @property
+    def short_description(self) -> str:
+        return self._long_text()[0]
+
+    @property
+    def header_image(self) -> str:
+        return self._long_text()[1]
+
+    def _long_text(self) -> Tuple[str, ...]:
+        if self._table.text_spans is None:
+            return ("",) * len(LONG_TEXT_FIELDS)
+        # 적재 후 파일이 다시 쓰였으면 바이트 구간 대신 전체를 다시 파싱 (현재 시그니처가 캐시 키에 포함)
+        signature = _file_signature(self._table.source)
+        span = None
+        if signature == self._table.source_signature:
+            start, end = self._table.text_spans[self._row]
+            span = (int(start), int(end))
+        return _load_long_text(self._table.source, signature, self.appid, span)
+
+
+class MetadataTable(Mapping):
+    """Column-wise game metadata keyed by appid (str or int)"""
+
+    def __init__(self, data: Dict, source: Optional[str] = None, spans: Optional[Dict[str, Tuple[int, int]]] = None,
+                 source_signature: Optional[Tuple[int, int]] = None):
+        keys = sorted(data, key=int)
+        rows = [(int(key), data[key]) for key in keys]
+        self.source = source
+        # 적재 시점 원본 파일의 (st_mtime_ns, st_size); 바이트 구간이 여전히 유효한지 확인용
+        self.source_signature = source_signature
+        self.appids = np.array([appid for appid, _ in rows], dtype=np.int64)
+        # 설명/이미지 URL은 원본 파일의 게임별 바이트 구간으로만 보관
+        self.text_spans = None
+        if source is not None and spans is not None and source_signature is not None:
+            self.text_spans = np.array([spans[key] for key in keys], dtype=np.int64).reshape(-1, 2)
+
+        names = [meta.get("name", "Unknown").encode("utf-8") for _, meta in rows]
+        self.names = b"".join(names)
+        self.name_offsets = np.zeros(len(names) + 1, dtype=np.int64)
+        np.cumsum([len(name) for name in names], out=self.name_offsets[1:])
+
+        # 장르/카테고리 조합과 출시일은 풀에 한 번만 저장하고 코드로 참조
+        tag_index: Dict[Tuple[str, ...], int] = {}
+        date_index: Dict[Tuple[str, Optional[str]], int] = {}
+        self.tag_pool: List[Tuple[str, ...]] = []
+        self.date_pool: List[str] = []
+        parsed_dates: List[Optional[date]] = []
+
+        def tag_code(values) -> int:
+            key = tuple(sys.intern(str(value)) for value in values or ())
+            if key not in tag_index:
+                tag_index[key] = len(self.tag_pool)
+                self.tag_pool.append(key)
+            return tag_index[key]
+
+        def date_code(meta) -> int:
+            key = (str(meta.get("release_date", "Unknown")), meta.get("release_date_iso"))
+            if key not in date_index:
+                date_index[key] = len(self.date_pool)
+                self.date_pool.append(key[0])
+                parsed_dates.append(_release_date(*key))
+            return date_index[key]
+
+        self.genre_codes = np.array([tag_code(meta.get("genres")) for _, meta in rows], dtype=np.int32)
+        self.category_codes = np.array([tag_code(meta.get("categories")) for _, meta in rows], dtype=np.int32)
+        self.date_codes = np.array([date_code(meta) for _, meta in rows], dtype=np.int32)
+        self.prices = np.array([float(meta.get("price") or 0) for _, meta in rows], dtype=np.float64)
+        # date_pool과 같은 순서의 파싱된 출시일 (파싱 불가 시 NaT); 행별 값은 date_codes로 조회
+        self.release_date_pool = np.array(parsed_dates, dtype="datetime64[D]")
+
+    def _row(self, key) -> Optional[int]:
+        try:
+            appid = int(key)
+        except (TypeError, ValueError):
+            return None
+        row = int(np.searchsorted(self.appids, appid))
+        if row < len(self.appids) and self.appids[row] == appid:
+            return row
+        return None
+
+    def __getitem__(self, key) -> GameMeta:
+        row = self._row(key)
+        if row is None:
+            raise KeyError(key)
+        return GameMeta(self, row)
+
+    def __contains__(self, key) -> bool:
+        return self._row(key) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return (str(appid) for appid in self.appids)
+
+    def __len__(self) -> int:
+        return len(self.appids)
+
+
+def load_metadata_file(path: str) -> MetadataTable:
+    with open(path, "rb") as f:
+        signature = _file_signature(f.fileno())
+        data, spans = _parse_with_spans(f.read())
+    return MetadataTable(data, path, spans, signature)
+
+
+def measure(path: str) -> Dict[str, float]:
+    """Compare retained bytes per game for plain dicts vs MetadataTable"""
+    with open(path, "rb") as f:
+        signature = _file_signature(f.fileno())
+        raw = f.read()
+
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    plain = json.loads(raw)
+    plain_bytes = tracemalloc.get_traced_memory()[0] - baseline
+    del plain
+
+    baseline = tracemalloc.get_traced_memory()[0]
+    data, spans = _parse_with_spans(raw)
+    table = MetadataTable(data, path, spans, signature)
+    del data, spans
+    table_bytes = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+
+    games = max(len(table), 1)
+    return {
+        "games": len(table),
+        "dict_bytes_per_game": plain_bytes / games,
+        "compact_bytes_per_game": table_bytes / games,
+        "ratio": plain_bytes / table_bytes if table_bytes else 0.0,
+    }
+
+
+def main():
+    if len(sys.argv) != 2:
+        print("Usage: python -m steam_analytics.dashboard.records <game_metadata_*.json>")
+        sys.exit(1)
+    result = measure(sys.argv[1])
+    print(f"Games: {result['games']}")
+    print(f"dict records:    {result['dict_bytes_per_game']:.0f} bytes/game")
+    print(f"compact records: {result['compact_bytes_per_game']:.0f} bytes/game")
+    print(f"Reduction: {result['ratio']:.1f}x")
+
+if __name__ == "__main__":
+    main()
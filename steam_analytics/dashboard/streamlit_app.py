@@ -4,6 +4,7 @@ import json
 import os
 from PIL import Image
 import sys
+import sqlite3
 from pathlib import Path
 import numpy as np
 import matplotlib.pyplot as plt
@@ -18,6 +19,14 @@ scraper_path = str(Path(__file__).parent.parent / "scraper")
 if scraper_path not in sys.path:
     sys.path.append(scraper_path)
 
+from steam_analytics.dashboard.cohorts import release_cohorts
+from steam_analytics.dashboard.cooccurrence import build_cooccurrence, top_pairs
+from steam_analytics.dashboard.records import compact_top100, load_metadata_file
+from steam_analytics.history.query import EXAMPLE_QUERY, MAX_ROW_LIMIT, QueryError, run_query
+from steam_analytics.history.backfill import sync_raw_files
+from steam_analytics.history.store import connect
+from profiling import profile_run, profiling_enabled
+
 # 한글 폰트 설정
 plt.rcParams['font.family'] = 'DejaVu Sans'
 # Windows에서 한글 폰트 설정
@@ -42,10 +51,8 @@ def load_latest_top100():
     try:
         with open(filepath, "r", encoding="utf-8") as f:
             data = json.load(f)
-        # Ensure 'current_players' is an integer, default to 0 if missing or invalid
-        for game in data:
-            game['current_players'] = int(game.get('current_players', 0))
-        return data
+        # Slotted records; 'current_players' is coerced to an integer, default 0
+        return compact_top100(data)
     except Exception as e:
         st.error(f"Error loading top100 games JSON: {e}")
         return None
@@ -58,8 +65,28 @@ def load_latest_metadata():
         st.error("No game metadata file found. Please refresh data.")
         return None
     latest_file = max(files)
-    with open(os.path.join(raw_data_dir, latest_file), "r", encoding="utf-8") as f:
-        return json.load(f)
+    # Column-wise table; long text fields are read back from the file on demand
+    return load_metadata_file(os.path.join(raw_data_dir, latest_file))
+
+@st.cache_data(ttl=3600) # Cache data for 1 hour
+def load_cooccurrence(top100, metadata_source, _metadata):
+    # MetadataTable is not hashable by st.cache_data; key the cache on its source file instead
+    return build_cooccurrence(top100, _metadata)
+
+@st.cache_data(ttl=3600) # Sync history at most once an hour
+def sync_history():
+    conn = connect()
+    try:
+        return sync_raw_files(conn)
+    finally:
+        conn.close()
+
+def profiling_requested():
+    # ?profile=1 쿼리 파라미터로 이번 rerun만 프로파일링
+    try:
+        return st.query_params.get("profile") == "1"
+    except AttributeError:
+        return False
 
 def load_css(file_name):
     css_path = os.path.join(os.path.dirname(__file__), file_name)
@@ -80,6 +107,9 @@ def main():
             "Top 10 동시접속자수",
             "인기 장르 분석",
             "인기 카테고리 분석", 
+            "장르 × 카테고리 조합 분석",
+            "출시 코호트 분석",
+            "사용자 정의 쿼리",
             "게임 세부 검색"
         ]
     )
@@ -339,6 +369,87 @@ def main():
         detailed_df = pd.DataFrame(detailed_stats).sort_values('Total Players', ascending=False)
         st.dataframe(detailed_df, use_container_width=True, hide_index=True)
 
+    elif visualization == "장르 × 카테고리 조합 분석":
+        st.header("장르 × 카테고리 조합 분석")
+
+        # 게임별 장르/카테고리를 불리언 행렬로 인코딩한 뒤 행렬곱으로 조합별 접속자수 계산
+        cooccurrence = load_cooccurrence(top100, metadata.source, metadata)
+        pairs = top_pairs(cooccurrence, n=20)
+
+        st.subheader("접속자수 상위 조합")
+        if not pairs.empty:
+            chart_df = pairs.head(10).copy()
+            chart_df["Pair"] = chart_df["Genre"] + " + " + chart_df["Category"]
+            st.bar_chart(chart_df.set_index("Pair")["Total Players"])
+            st.dataframe(pairs, use_container_width=True, hide_index=True)
+        else:
+            st.info("장르 × 카테고리 조합 데이터가 없습니다.")
+
+        # 전체 조합 행렬
+        st.subheader("조합별 상세 행렬")
+        matrix_type = st.selectbox(
+            "행렬 유형 선택:",
+            ["접속자수 기준", "게임 수 기준"],
+            index=0
+        )
+        matrix_df = cooccurrence["players"] if matrix_type == "접속자수 기준" else cooccurrence["games"]
+        if not matrix_df.empty:
+            # 합계가 큰 장르/카테고리 순으로 정렬
+            matrix_df = matrix_df.loc[
+                matrix_df.sum(axis=1).sort_values(ascending=False).index,
+                matrix_df.sum(axis=0).sort_values(ascending=False).index
+            ]
+            st.dataframe(matrix_df, use_container_width=True)
+
+    elif visualization == "출시 코호트 분석":
+        st.header("출시 코호트 분석")
+
+        cohort_type = st.selectbox(
+            "코호트 기준 선택:",
+            ["출시 연도", "출시 후 경과 기간"],
+            index=0
+        )
+        # 적재 시 파싱해 둔 출시일 열을 사용해 벡터화된 groupby로 집계
+        cohort_df = release_cohorts(top100, metadata, by="year" if cohort_type == "출시 연도" else "age")
+
+        if not cohort_df.empty:
+            st.subheader(f"{cohort_type}별 접속자 비율")
+            st.bar_chart(cohort_df.set_index("Cohort")["Player Share (%)"])
+            st.dataframe(cohort_df, use_container_width=True, hide_index=True)
+        else:
+            st.info("출시일 데이터가 없습니다.")
+
+    elif visualization == "사용자 정의 쿼리":
+        st.header("사용자 정의 쿼리")
+        st.write(
+            "스냅샷 히스토리(SQLite)에 읽기 전용 SQL을 실행합니다. "
+            "테이블: `snapshots`, `game_snapshots`, `games`, `game_genres`, `game_categories`, 뷰: `snapshot_games`"
+        )
+
+        try:
+            sync_history()
+        except sqlite3.Error as e:
+            st.error(f"히스토리 동기화 중 오류가 발생했습니다: {e}")
+        sql = st.text_area("SQL", value=EXAMPLE_QUERY, height=200)
+        col1, col2 = st.columns(2)
+        with col1:
+            row_limit = st.number_input("최대 행 수", min_value=1, max_value=MAX_ROW_LIMIT, value=1000, step=100)
+        with col2:
+            timeout = st.number_input("시간 제한 (초)", min_value=0.5, max_value=30.0, value=5.0, step=0.5)
+
+        if st.button("실행"):
+            try:
+                columns, rows, truncated = run_query(sql, row_limit=row_limit, timeout=timeout)
+            except QueryError as e:
+                st.error(f"쿼리 오류: {e}")
+            else:
+                result_df = pd.DataFrame(rows, columns=columns)
+                st.dataframe(result_df, use_container_width=True, hide_index=True)
+                if truncated:
+                    st.warning(f"결과가 {row_limit}행으로 잘렸습니다.")
+                else:
+                    st.write(f"총 {len(result_df)}행")
+
     elif visualization == "게임 세부 검색":
         st.header("게임 세부 검색") 
         game_names = [meta.get("name", str(appid)) for appid, meta in metadata.items()]
@@ -361,4 +472,5 @@ def main():
                 st.image(meta["header_image"], width=400)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    with profile_run("dashboard", enabled=profiling_enabled() or profiling_requested()):
+        main()
\ No newline at end of file
@@ -0,0 +1,3 @@
+"""
+Snapshot history store and query layer for Steam analytics
+"""
@@ -0,0 +1,258 @@
+"""
+Parallel backfill of data/raw snapshot and metadata files into the history store.
+
+Files are parsed and validated in a process pool; the main process writes
+them to SQLite in batched transactions that also record each file in
+``ingested_files``, so an interrupted run can simply be restarted and
+re-running over the same files is a no-op.
+
+Metadata files written by fetch_game_metadata only carry HHMMSS, so each one
+is paired with the snapshot whose time of day matches, choosing the date
+closest to the file's modification time. Pairing needs only file names and
+times, so metadata files are parsed after the snapshots, in apply order, and
+written as they arrive with a bounded number of results in flight.
+
+    python -m steam_analytics.history.backfill --workers 8
+"""
+import argparse
+import csv
+import json
+import os
+import sqlite3
+import time
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from steam_analytics.history.store import (
+    HISTORY_DB_PATH,
+    METADATA_PATTERN,
+    RAW_DATA_DIR,
+    connect,
+    insert_snapshot,
+    snapshot_taken_at,
+    upsert_metadata,
+)
+from steam_analytics.scraper.release_dates import normalize_release_date
+
+DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+COMMIT_EVERY = 200
+# 워커당 동시에 파싱 중이거나 기록을 기다리는 파일 수 (메타데이터 파일은 수 MB일 수 있음)
+IN_FLIGHT_PER_WORKER = 4
+
+
+def _to_int(value) -> Optional[int]:
+    if value is None or value == "":
+        return None
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+def _to_datetime(value) -> Optional[str]:
+    """Normalize an ISO timestamp (e.g. players_updated_at) to the store's datetime format"""
+    if not value or not isinstance(value, str):
+        return None
+    try:
+        return datetime.fromisoformat(value).strftime(DATETIME_FORMAT)
+    except ValueError:
+        return None
+
+
+def validate_snapshot(rows: List[Dict]) -> List[Dict]:
+    """Drop rows without a valid appid and deduplicate by appid (best rank wins)"""
+    games = {}
+    for row in rows:
+        appid = _to_int(row.get("appid"))
+        if appid is None or appid <= 0:
+            continue
+        game = {
+            "appid": appid,
+            "rank": _to_int(row.get("rank")),
+            "current_players": max(_to_int(row.get("current_players")) or 0, 0),
+            "peak_in_game": _to_int(row.get("peak_in_game")),
+            "players_updated_at": _to_datetime(row.get("players_updated_at")),
+        }
+        previous = games.get(appid)
+        if previous is None or (game["rank"] or float("inf")) < (previous["rank"] or float("inf")):
+            games[appid] = game
+    return list(games.values())
+
+
+def validate_metadata(data: Dict) -> Dict:
+    """Keep entries with an integer appid and coerce list/number fields"""
+    metadata = {}
+    for appid, meta in data.items():
+        if _to_int(appid) is None or not isinstance(meta, dict):
+            continue
+        try:
+            price = float(meta.get("price") or 0)
+        except (TypeError, ValueError):
+            price = 0.0
+        metadata[str(_to_int(appid))] = {
+            "name": str(meta.get("name", "Unknown")),
+            "genres": [str(genre) for genre in meta.get("genres") or [] if genre],
+            "categories": [str(category) for category in meta.get("categories") or [] if category],
+            "release_date": str(meta.get("release_date", "Unknown")),
+            "release_date_iso": meta.get("release_date_iso") or normalize_release_date(meta.get("release_date")),
+            "price": price,
+            "short_description": meta.get("short_description", ""),
+            "header_image": meta.get("header_image", ""),
+        }
+    return metadata
+
+
+def parse_file(path: str) -> Tuple[str, str, Optional[object], Optional[str]]:
+    """Parse one raw file in a worker process; returns (path, kind, data, error)"""
+    name = os.path.basename(path)
+    try:
+        if snapshot_taken_at(name) is not None:
+            if name.endswith(".csv"):
+                with open(path, "r", encoding="utf-8", newline="") as f:
+                    rows = list(csv.DictReader(f))
+            else:
+                with open(path, "r", encoding="utf-8") as f:
+                    rows = json.load(f)
+            return path, "snapshot", validate_snapshot(rows), None
+        with open(path, "r", encoding="utf-8") as f:
+            return path, "metadata", validate_metadata(json.load(f)), None
+    except Exception as e:
+        return path, "error", None, str(e)
+
+
+def pending_files(conn: sqlite3.Connection, raw_data_dir: Path) -> List[os.DirEntry]:
+    """List snapshot/metadata files that are new or changed since they were ingested"""
+    if not raw_data_dir.is_dir():
+        return []
+    ingested = dict(conn.execute("SELECT filename, mtime FROM ingested_files").fetchall())
+    files = []
+    for entry in os.scandir(raw_data_dir):
+        if snapshot_taken_at(entry.name) is None and not METADATA_PATTERN.match(entry.name):
+            continue
+        if ingested.get(entry.name) != entry.stat().st_mtime:
+            files.append(entry)
+    # 같은 시각의 JSON이 CSV보다 먼저 처리되도록 정렬
+    return sorted(files, key=lambda e: (e.name.endswith(".csv"), e.name))
+
+
+def pair_snapshot(filename: str, mtime: float, snapshots: List[Tuple[int, datetime]]) -> Tuple[Optional[int], str]:
+    """Pick the snapshot a metadata file belongs to; returns (snapshot_id, metadata_at)"""
+    match = METADATA_PATTERN.match(filename)
+    modified = datetime.fromtimestamp(mtime).replace(microsecond=0)
+    if match.group(1):
+        target = datetime.strptime(match.group(1) + match.group(2), "%Y%m%d%H%M%S")
+        candidates = snapshots
+    else:
+        # HHMMSS만 있는 경우: 같은 시각의 스냅샷 중 파일 수정 시각과 가장 가까운 날짜
+        target = modified
+        candidates = [s for s in snapshots if s[1].strftime("%H%M%S") == match.group(2)] or snapshots
+    if not candidates:
+        return None, target.strftime(DATETIME_FORMAT)
+    snapshot_id, taken_at = min(candidates, key=lambda s: abs((s[1] - target).total_seconds()))
+    return snapshot_id, taken_at.strftime(DATETIME_FORMAT)
+
+
+def parse_files(paths: List[str], executor: Optional[Executor], in_flight: int) -> Iterator[Tuple]:
+    """Yield parse_file results in order, keeping at most in_flight files parsed ahead"""
+    if executor is None:
+        yield from map(parse_file, paths)
+        return
+    window = deque()
+    for path in paths:
+        window.append(executor.submit(parse_file, path))
+        if len(window) >= in_flight:
+            yield window.popleft().result()
+    while window:
+        yield window.popleft().result()
+
+
+def mark_ingested(conn: sqlite3.Connection, entry: os.DirEntry, kind: str):
+    conn.execute("INSERT OR REPLACE INTO ingested_files VALUES (?, ?, ?)", (entry.name, kind, entry.stat().st_mtime))
+
+
+def import_raw_files(conn: sqlite3.Connection, raw_data_dir: Path = RAW_DATA_DIR, workers: int = 0) -> Dict[str, int]:
+    """Import pending raw files; workers=0 parses in-process"""
+    counts = {"snapshots": 0, "metadata": 0, "skipped": 0, "errors": 0}
+    entries = pending_files(conn, raw_data_dir)
+    if not entries:
+        return counts
+    snapshot_entries = [entry for entry in entries if snapshot_taken_at(entry.name) is not None]
+    metadata_entries = [entry for entry in entries if snapshot_taken_at(entry.name) is None]
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 0 else None
+    in_flight = max(workers, 1) * IN_FLIGHT_PER_WORKER
+
+    pending = 0
+    try:
+        results = parse_files([entry.path for entry in snapshot_entries], executor, in_flight)
+        for entry, (_, kind, data, error) in zip(snapshot_entries, results):
+            if kind == "error":
+                print(f"Error loading {entry.name}: {error}")
+                counts["errors"] += 1
+                continue
+            # 파일 단위 기록과 ingested_files 표시가 같은 트랜잭션에 들어가므로 중단 후 재실행해도 안전
+            if insert_snapshot(conn, snapshot_taken_at(entry.name), entry.name, data):
+                counts["snapshots"] += 1
+            else:
+                counts["skipped"] += 1
+            mark_ingested(conn, entry, kind)
+            pending += 1
+            if pending >= COMMIT_EVERY:
+                conn.commit()
+                pending = 0
+        conn.commit()
+
+        # 모든 스냅샷을 넣은 뒤 파일명/수정 시각만으로 메타데이터를 짝짓고, 오래된 것부터 파싱하며 바로 적용
+        snapshots = [
+            (snapshot_id, datetime.strptime(taken_at, DATETIME_FORMAT))
+            for snapshot_id, taken_at in conn.execute("SELECT snapshot_id, taken_at FROM snapshots")
+        ]
+        paired = []
+        for entry in metadata_entries:
+            snapshot_id, metadata_at = pair_snapshot(entry.name, entry.stat().st_mtime, snapshots)
+            paired.append((metadata_at, entry, snapshot_id))
+        paired.sort(key=lambda p: (p[0], p[1].name))
+        results = parse_files([entry.path for _, entry, _ in paired], executor, in_flight)
+        for (metadata_at, entry, snapshot_id), (_, kind, data, error) in zip(paired, results):
+            if kind == "error":
+                print(f"Error loading {entry.name}: {error}")
+                counts["errors"] += 1
+                continue
+            with conn:
+                upsert_metadata(conn, data, metadata_at)
+                if snapshot_id is not None:
+                    conn.execute("INSERT OR REPLACE INTO snapshot_metadata VALUES (?, ?)", (snapshot_id, entry.name))
+                mark_ingested(conn, entry, "metadata")
+            counts["metadata"] += 1
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+    return counts
+
+
+def sync_raw_files(conn: sqlite3.Connection, raw_data_dir: Path = RAW_DATA_DIR) -> Dict[str, int]:
+    """Incremental in-process sync used by the dashboard"""
+    return import_raw_files(conn, raw_data_dir, workers=0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Backfill data/raw history into the SQLite history store")
+    parser.add_argument("--raw-dir", type=Path, default=RAW_DATA_DIR)
+    parser.add_argument("--db", type=Path, default=HISTORY_DB_PATH)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Parser processes (0 = in-process)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    conn = connect(args.db)
+    try:
+        counts = import_raw_files(conn, args.raw_dir, args.workers)
+    finally:
+        conn.close()
+    elapsed = time.perf_counter() - start
+    print(f"Imported {counts['snapshots']} snapshots and {counts['metadata']} metadata files "
+          f"({counts['skipped']} duplicates skipped, {counts['errors']} errors) in {elapsed:.1f}s")
+
+if __name__ == "__main__":
+    main()
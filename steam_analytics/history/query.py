@@ -0,0 +1,86 @@
+"""
+Guarded read-only SQL execution over the history store
+"""
+import sqlite3
+import time
+from pathlib import Path
+from typing import List, Tuple
+
+from steam_analytics.history.store import HISTORY_DB_PATH
+
+MAX_ROW_LIMIT = 10000
+# 값 하나와 결과 전체의 최대 크기 (randomblob/zeroblob 등으로 메모리를 고갈시키지 않도록)
+MAX_VALUE_BYTES = 1_000_000
+MAX_RESULT_BYTES = 50_000_000
+
+# 읽기 전용 쿼리에 필요한 권한만 허용
+ALLOWED_ACTIONS = {
+    sqlite3.SQLITE_SELECT,
+    sqlite3.SQLITE_READ,
+    sqlite3.SQLITE_FUNCTION,
+    sqlite3.SQLITE_RECURSIVE,
+}
+
+EXAMPLE_QUERY = """SELECT sg.taken_at, sg.name, sg.current_players
+FROM snapshot_games sg
+JOIN game_genres gg ON gg.appid = sg.appid
+WHERE gg.genre = 'Strategy'
+  AND sg.current_players > 50000
+  AND sg.taken_at >= datetime('now', 'localtime', '-7 days')
+ORDER BY sg.taken_at DESC, sg.current_players DESC"""
+
+
+class QueryError(Exception):
+    pass
+
+
+def _authorizer(action, arg1, arg2, db_name, trigger):
+    return sqlite3.SQLITE_OK if action in ALLOWED_ACTIONS else sqlite3.SQLITE_DENY
+
+
+def run_query(sql: str, row_limit: int = 1000, timeout: float = 5.0,
+              db_path: Path = HISTORY_DB_PATH) -> Tuple[List[str], List[tuple], bool]:
+    """Run a single read-only statement with a row limit and timeout.
+
+    Returns (columns, rows, truncated).
+    """
+    sql = sql.strip().rstrip(";")
+    if not sql:
+        raise QueryError("쿼리가 비어 있습니다.")
+    if not db_path.exists():
+        raise QueryError("히스토리 데이터베이스가 없습니다. 데이터를 먼저 동기화해주세요.")
+    row_limit = max(1, min(int(row_limit), MAX_ROW_LIMIT))
+
+    conn = sqlite3.connect(f"{db_path.resolve().as_uri()}?mode=ro", uri=True)
+    try:
+        conn.set_authorizer(_authorizer)
+        conn.setlimit(sqlite3.SQLITE_LIMIT_LENGTH, MAX_VALUE_BYTES)
+        # 실행 시간이 제한을 넘으면 쿼리를 중단
+        deadline = time.monotonic() + timeout
+        conn.set_progress_handler(lambda: 1 if time.monotonic() > deadline else 0, 10000)
+        try:
+            cursor = conn.execute(sql)
+            rows = []
+            result_bytes = 0
+            for row in cursor:
+                result_bytes += sum(len(value) for value in row if isinstance(value, (str, bytes)))
+                if result_bytes > MAX_RESULT_BYTES:
+                    raise QueryError(f"결과 크기가 {MAX_RESULT_BYTES // 1_000_000}MB를 초과했습니다.")
+                rows.append(row)
+                if len(rows) > row_limit:
+                    break
+        except sqlite3.OperationalError as e:
+            if str(e) == "interrupted":
+                raise QueryError(f"쿼리 실행 시간이 {timeout:g}초를 초과했습니다.") from e
+            raise QueryError(str(e)) from e
+        except sqlite3.DataError as e:
+            raise QueryError(f"값 하나의 크기가 {MAX_VALUE_BYTES // 1_000_000}MB를 초과했습니다.") from e
+        except (sqlite3.Error, sqlite3.Warning) as e:
+            # 여러 문장, 쓰기 시도(권한 거부) 등
+            raise QueryError(str(e)) from e
+        columns = [description[0] for description in cursor.description or []]
+    finally:
+        conn.close()
+
+    truncated = len(rows) > row_limit
+    return columns, rows[:row_limit], truncated
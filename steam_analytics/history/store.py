@@ -0,0 +1,166 @@
+"""
+SQLite history store over the top100 snapshot and metadata files in data/raw.
+
+Files are loaded by steam_analytics.history.backfill.
+"""
+import re
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+RAW_DATA_DIR = PROJECT_ROOT / "data" / "raw"
+HISTORY_DB_PATH = PROJECT_ROOT / "data" / "history.db"
+
+SNAPSHOT_PATTERN = re.compile(r"^top100_games_(\d{8})_(\d{6})\.(json|csv)$")
+METADATA_PATTERN = re.compile(r"^game_metadata_(?:(\d{8})_)?(\d{6})\.json$")
+
+# PRAGMA user_version; 예전 버전으로 만든 DB는 connect()에서 _migrate로 올림
+SCHEMA_VERSION = 3
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS ingested_files (
+    filename TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    mtime REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS snapshots (
+    snapshot_id INTEGER PRIMARY KEY,
+    taken_at TEXT NOT NULL UNIQUE,
+    source_file TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS game_snapshots (
+    snapshot_id INTEGER NOT NULL REFERENCES snapshots(snapshot_id),
+    appid INTEGER NOT NULL,
+    rank INTEGER,
+    current_players INTEGER NOT NULL DEFAULT 0,
+    peak_in_game INTEGER,
+    players_updated_at TEXT,
+    PRIMARY KEY (snapshot_id, appid)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS games (
+    appid INTEGER PRIMARY KEY,
+    name TEXT,
+    release_date TEXT,
+    release_date_iso TEXT,
+    price REAL,
+    short_description TEXT,
+    header_image TEXT,
+    metadata_at TEXT
+);
+CREATE TABLE IF NOT EXISTS snapshot_metadata (
+    snapshot_id INTEGER PRIMARY KEY REFERENCES snapshots(snapshot_id),
+    metadata_file TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS game_genres (
+    appid INTEGER NOT NULL,
+    genre TEXT NOT NULL,
+    PRIMARY KEY (appid, genre)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS game_categories (
+    appid INTEGER NOT NULL,
+    category TEXT NOT NULL,
+    PRIMARY KEY (appid, category)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_game_snapshots_appid ON game_snapshots(appid, snapshot_id);
+CREATE INDEX IF NOT EXISTS idx_game_snapshots_players ON game_snapshots(current_players);
+CREATE INDEX IF NOT EXISTS idx_game_genres_genre ON game_genres(genre, appid);
+CREATE INDEX IF NOT EXISTS idx_game_categories_category ON game_categories(category, appid);
+CREATE VIEW IF NOT EXISTS snapshot_games AS
+    SELECT s.taken_at, gs.snapshot_id, gs.appid, g.name, gs.rank, gs.current_players, gs.players_updated_at,
+           gs.peak_in_game, g.release_date, g.release_date_iso, g.price
+    FROM game_snapshots gs
+    JOIN snapshots s ON s.snapshot_id = gs.snapshot_id
+    LEFT JOIN games g ON g.appid = gs.appid;
+"""
+
+
+def _add_column(conn: sqlite3.Connection, table: str, column: str, declaration: str):
+    columns = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+    if column not in columns:
+        conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {declaration}")
+
+
+def _migrate(conn: sqlite3.Connection, version: int):
+    """Upgrade a database created at an older schema version (each step is idempotent)"""
+    if version < 1:
+        # games.metadata_at, snapshot_metadata 추가; 메타데이터 파일은 다시 가져와 시각과 스냅샷을 채움
+        _add_column(conn, "games", "metadata_at", "TEXT")
+        conn.execute("DELETE FROM ingested_files WHERE kind = 'metadata'")
+    if version < 2:
+        # games.release_date_iso 추가 및 뷰 재생성; 메타데이터 파일을 다시 가져와 값을 채움
+        _add_column(conn, "games", "release_date_iso", "TEXT")
+        conn.execute("DROP VIEW IF EXISTS snapshot_games")
+        conn.execute("DELETE FROM ingested_files WHERE kind = 'metadata'")
+    if version < 3:
+        # game_snapshots.players_updated_at 추가 (fast/selective 모드에서 재사용한 접속자수 구분)
+        _add_column(conn, "game_snapshots", "players_updated_at", "TEXT")
+        conn.execute("DROP VIEW IF EXISTS snapshot_games")
+
+
+def connect(db_path: Path = HISTORY_DB_PATH) -> sqlite3.Connection:
+    """Open the history database, creating or upgrading the schema if needed"""
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(db_path))
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    existing = conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'games'").fetchone()
+    if existing and version < SCHEMA_VERSION:
+        with conn:
+            _migrate(conn, version)
+    conn.executescript(SCHEMA)
+    if version < SCHEMA_VERSION:
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    return conn
+
+
+def snapshot_taken_at(filename: str) -> Optional[str]:
+    """Parse top100_games_YYYYMMDD_HHMMSS.{json,csv} into an SQLite datetime string"""
+    match = SNAPSHOT_PATTERN.match(filename)
+    if not match:
+        return None
+    return datetime.strptime(match.group(1) + match.group(2), "%Y%m%d%H%M%S").strftime("%Y-%m-%d %H:%M:%S")
+
+
+def insert_snapshot(conn: sqlite3.Connection, taken_at: str, source_file: str, games: List[Dict]) -> bool:
+    """Insert one snapshot and its rows; returns False if the snapshot already exists"""
+    cursor = conn.execute(
+        "INSERT OR IGNORE INTO snapshots (taken_at, source_file) VALUES (?, ?)", (taken_at, source_file)
+    )
+    if cursor.rowcount == 0:
+        return False
+    snapshot_id = cursor.lastrowid
+    conn.executemany(
+        "INSERT OR IGNORE INTO game_snapshots "
+        "(snapshot_id, appid, rank, current_players, peak_in_game, players_updated_at) VALUES (?, ?, ?, ?, ?, ?)",
+        [
+            (snapshot_id, int(game["appid"]), game.get("rank"), int(game.get("current_players") or 0),
+             game.get("peak_in_game"), game.get("players_updated_at"))
+            for game in games
+        ],
+    )
+    return True
+
+
+def upsert_metadata(conn: sqlite3.Connection, metadata: Dict, metadata_at: str):
+    """Insert or replace game metadata unless a newer version is already stored"""
+    current = dict(conn.execute("SELECT appid, metadata_at FROM games").fetchall())
+    for appid, meta in metadata.items():
+        appid = int(appid)
+        if (current.get(appid) or "") > metadata_at:
+            continue
+        conn.execute(
+            "INSERT OR REPLACE INTO games "
+            "(appid, name, release_date, release_date_iso, price, short_description, header_image, metadata_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (appid, meta.get("name"), meta.get("release_date"), meta.get("release_date_iso"), meta.get("price"),
+             meta.get("short_description"), meta.get("header_image"), metadata_at),
+        )
+        conn.execute("DELETE FROM game_genres WHERE appid = ?", (appid,))
+        conn.execute("DELETE FROM game_categories WHERE appid = ?", (appid,))
+        conn.executemany("INSERT OR IGNORE INTO game_genres VALUES (?, ?)",
+                         [(appid, genre) for genre in meta.get("genres", [])])
+        conn.executemany("INSERT OR IGNORE INTO game_categories VALUES (?, ?)",
+                         [(appid, category) for category in meta.get("categories", [])])
@@ -1 +1,7 @@
-STEAM_API_KEY = "7B63210EEDE60439C533C17F90F7E3F9" 
\ No newline at end of file
+import os
+
+STEAM_API_KEY = "7B63210EEDE60439C533C17F90F7E3F9"
+
+# 로컬 목(mock) 서버 등으로 엔드포인트를 바꿀 때 환경 변수로 덮어쓸 수 있음
+STEAM_API_BASE_URL = os.environ.get("STEAM_API_BASE_URL", "https://api.steampowered.com")
+STEAM_STORE_API_URL = os.environ.get("STEAM_STORE_API_URL", "https://store.steampowered.com/api/appdetails")
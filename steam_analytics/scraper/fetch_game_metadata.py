@@ -4,12 +4,14 @@ import json
 from datetime import datetime
 import os
 from typing import List, Dict, Optional
-from config import STEAM_API_KEY
+from profiling import profile_run
+from release_dates import normalize_release_date
+from config import STEAM_API_KEY, STEAM_API_BASE_URL, STEAM_STORE_API_URL
 
 class SteamDataFetcher:
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, base_url: str = STEAM_API_BASE_URL):
         self.api_key = api_key
-        self.base_url = "https://api.steampowered.com"
+        self.base_url = base_url
 
     def get_current_players(self, app_id: int) -> Optional[int]:
         """Get current number of players for a specific game"""
@@ -54,8 +56,8 @@ class SteamDataFetcher:
             json.dump(data, f, ensure_ascii=False, indent=2)
 
 class SteamGameMetadata:
-    def __init__(self):
-        self.base_url = "https://store.steampowered.com/api/appdetails"
+    def __init__(self, base_url: str = STEAM_STORE_API_URL):
+        self.base_url = base_url
         
     def get_game_details(self, app_id: int) -> Optional[Dict]:
         """Get detailed information about a game from the Steam store API"""
@@ -103,6 +105,7 @@ def main():
                 "name": details.get("name", "Unknown"),
                 "genres": [genre["description"] for genre in details.get("genres", [])],
                 "release_date": details.get("release_date", {}).get("date", "Unknown"),
+                "release_date_iso": normalize_release_date(details.get("release_date", {}).get("date")),
                 "price": details.get("price_overview", {}).get("final", 0) / 100 if details.get("price_overview") else 0,
                 "categories": [cat["description"] for cat in details.get("categories", [])],
                 "short_description": details.get("short_description", ""),
@@ -114,4 +117,5 @@ def main():
     print(f"Successfully saved game metadata to data/raw/game_metadata_{timestamp}.json")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    with profile_run("fetch_game_metadata"):
+        main()
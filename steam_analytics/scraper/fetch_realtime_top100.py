@@ -1,15 +1,17 @@
 import requests
+import argparse
 import json
-from datetime import datetime
+from datetime import datetime, timedelta
 import os
-from typing import Dict, List, Optional
-from config import STEAM_API_KEY
+from typing import Dict, List, Optional, Set, Tuple
+from profiling import profile_run
+from config import STEAM_API_KEY, STEAM_API_BASE_URL
 import pandas as pd
 
 class SteamDataFetcher:
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, base_url: str = STEAM_API_BASE_URL):
         self.api_key = api_key
-        self.base_url = "https://api.steampowered.com"
+        self.base_url = base_url
         
     def get_current_players(self, app_id: int) -> Optional[int]:
         """Get current number of players for a specific game"""
@@ -45,6 +47,27 @@ class SteamDataFetcher:
             print(f"Error fetching top 100 games: {str(e)}")
             return []
 
+    def load_latest_snapshot(self) -> Tuple[List[Dict], Optional[str]]:
+        """Load the most recent saved top 100 snapshot and its timestamp, if any"""
+        raw_data_dir = "data/raw"
+        if not os.path.isdir(raw_data_dir):
+            return [], None
+        files = [f for f in os.listdir(raw_data_dir) if f.startswith("top100_games_") and f.endswith(".json")]
+        if not files:
+            return [], None
+        latest_file = max(files)
+        try:
+            taken_at = datetime.strptime(latest_file[len("top100_games_"):-len(".json")], "%Y%m%d_%H%M%S")
+            taken_at = taken_at.isoformat(timespec="seconds")
+        except ValueError:
+            taken_at = None
+        try:
+            with open(os.path.join(raw_data_dir, latest_file), "r", encoding="utf-8") as f:
+                return json.load(f), taken_at
+        except Exception as e:
+            print(f"Error loading previous snapshot: {str(e)}")
+            return [], None
+
     def save_to_json(self, data: List[Dict], filename: str):
         """Save data to a JSON file"""
         os.makedirs("data/raw", exist_ok=True)
@@ -60,11 +83,75 @@ class SteamDataFetcher:
         df = pd.DataFrame(data)
         df.to_csv(filepath, index=False, encoding="utf-8")
 
+def build_snapshot_from_ranks(ranks: List[Dict], previous: List[Dict], previous_taken_at: Optional[str],
+                              now: datetime) -> List[Dict]:
+    """Fill current_players from the ranks payload, falling back to the previous snapshot"""
+    previous_by_appid = {game["appid"]: game for game in previous}
+    # players_updated_at 필드가 한 행에도 없는 예전 스냅샷은 스냅샷 시각을 갱신 시각으로 간주
+    legacy = bool(previous) and not any("players_updated_at" in game for game in previous)
+    for game in ranks:
+        if game.get("concurrent_in_game") is not None:
+            game["current_players"] = game["concurrent_in_game"]
+            game["players_updated_at"] = now.isoformat(timespec="seconds")
+            continue
+        # 랭크 응답에 동접자 수가 없으면 이전 스냅샷 값을 그대로 사용 (갱신 시각 유지)
+        prev = previous_by_appid.get(game["appid"])
+        if prev is None:
+            updated_at = None
+        elif legacy:
+            updated_at = previous_taken_at if prev.get("current_players") is not None else None
+        else:
+            updated_at = prev.get("players_updated_at")
+        if updated_at is not None:
+            game["current_players"] = prev["current_players"]
+            game["players_updated_at"] = updated_at
+        else:
+            game["current_players"] = 0
+            game["players_updated_at"] = None
+    return ranks
+
+
+def select_refresh_appids(games: List[Dict], watchlist: Set[int], stale_after: timedelta, now: datetime) -> List[int]:
+    """Pick apps that need a GetNumberOfCurrentPlayers call: watchlist, missing or stale counts"""
+    appids = []
+    for game in games:
+        updated_at = game.get("players_updated_at")
+        if (game["appid"] in watchlist
+                or updated_at is None
+                or now - datetime.fromisoformat(updated_at) > stale_after):
+            appids.append(game["appid"])
+    return appids
+
+
+def drop_stale_counts(games: List[Dict], stale_after: timedelta, now: datetime) -> int:
+    """Mark carried-forward counts older than stale_after as missing; returns how many were dropped"""
+    dropped = 0
+    for game in games:
+        updated_at = game.get("players_updated_at")
+        if updated_at is not None and now - datetime.fromisoformat(updated_at) > stale_after:
+            game["current_players"] = 0
+            game["players_updated_at"] = None
+            dropped += 1
+    return dropped
+
+
 def main():
+    parser = argparse.ArgumentParser(description="Fetch a Steam top 100 snapshot")
+    parser.add_argument(
+        "--mode",
+        choices=["full", "fast", "selective"],
+        default="full",
+        help="full: refresh every app, fast: ranks payload only, selective: refresh watchlist/missing/stale apps"
+    )
+    parser.add_argument("--watchlist", type=int, nargs="*", default=[], help="App ids always refreshed in selective mode")
+    parser.add_argument("--stale-minutes", type=float, default=60, help="Refresh (selective) or drop (fast) carried-forward counts older than this")
+    args = parser.parse_args()
+
     fetcher = SteamDataFetcher(STEAM_API_KEY)
     
     # 현재 시간을 파일명에 포함
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    now = datetime.now()
+    timestamp = now.strftime("%Y%m%d_%H%M%S")
     
     # Top 100 게임 데이터 수집
     print("Fetching top 100 games...")
@@ -76,12 +163,47 @@ def main():
     
     print(f"Successfully fetched {len(top_games)} games")
     
+    # 랭크 응답만으로 스냅샷 구성 후, 모드에 따라 개별 접속자수 갱신 대상 선택
+    if args.mode == "full":
+        refresh_appids = [game["appid"] for game in top_games]
+    else:
+        previous, previous_taken_at = fetcher.load_latest_snapshot()
+        build_snapshot_from_ranks(top_games, previous, previous_taken_at, now)
+        if args.mode == "fast":
+            refresh_appids = []
+        else:
+            refresh_appids = select_refresh_appids(
+                top_games, set(args.watchlist), timedelta(minutes=args.stale_minutes), now
+            )
+
     # 각 게임의 상세 정보 수집
-    print("Fetching current player counts...")
-    for i, game in enumerate(top_games, 1):
-        player_count = fetcher.get_current_players(game["appid"])
-        game["current_players"] = player_count if player_count is not None else 0
-        print(f"Progress: {i}/100 games processed")
+    print(f"Fetching current player counts for {len(refresh_appids)} games...")
+    games_by_appid = {game["appid"]: game for game in top_games}
+    for i, appid in enumerate(refresh_appids, 1):
+        game = games_by_appid[appid]
+        player_count = fetcher.get_current_players(appid)
+        if player_count is not None:
+            game["current_players"] = player_count
+            game["players_updated_at"] = datetime.now().isoformat(timespec="seconds")
+        elif args.mode == "full":
+            game["current_players"] = 0
+            game["players_updated_at"] = None
+        print(f"Progress: {i}/{len(refresh_appids)} games processed")
+    print(f"API calls for this snapshot: {1 + len(refresh_appids)}")
+
+    # 이전 스냅샷에서 가져온 접속자수가 너무 오래되었으면 현재 값으로 저장하지 않음
+    if args.mode != "full":
+        stale = drop_stale_counts(top_games, timedelta(minutes=args.stale_minutes), now)
+        if stale:
+            print(f"Warning: {stale} player counts older than {args.stale_minutes:g} minutes were dropped")
+
+    # 접속자수가 하나도 없는 스냅샷은 최신 데이터로 저장하지 않음
+    missing = sum(1 for game in top_games if game.get("players_updated_at") is None)
+    if args.mode != "full" and missing == len(top_games):
+        print("No player counts available for this snapshot. Run with --mode full or --mode selective first.")
+        return
+    if args.mode != "full" and missing:
+        print(f"Warning: {missing} games have no player count and were saved as 0")
     
     # 데이터 저장
     json_filename = f"top100_games_{timestamp}.json"
@@ -93,4 +215,5 @@ def main():
     print(f"Successfully saved top 100 games data to data/raw/{csv_filename}")
 
 if __name__ == "__main__":
-    main()
+    with profile_run("fetch_realtime_top100"):
+        main()
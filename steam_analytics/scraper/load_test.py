@@ -0,0 +1,127 @@
+"""
+Scraper load-test harness against the local mock Steam server.
+
+Runs the fetch_realtime_top100 and fetch_game_metadata fetchers against
+mock_steam_server and reports throughput and tail latency per endpoint.
+
+    python load_test.py --rounds 5 --concurrency 16 --latency-ms 30 --throttle-rate 0.02
+    python load_test.py --base-url http://127.0.0.1:8765 --max-error-rate 0.05
+"""
+import argparse
+import contextlib
+import io
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List
+
+import numpy as np
+
+# 측정 라운드가 모두 실패했을 때 appid 목록을 얻기 위한 (측정에서 제외되는) 재시도 횟수
+SETUP_RETRIES = 20
+
+from config import STEAM_API_KEY
+from fetch_game_metadata import SteamGameMetadata
+from fetch_realtime_top100 import SteamDataFetcher
+from mock_steam_server import add_server_arguments, build_from_args, server_url, start_in_background
+
+
+def timed_call(func: Callable, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def run_endpoint(name: str, func: Callable, args_list: List, concurrency: int) -> Dict:
+    """Call func once per argument with a thread pool and summarize the latencies"""
+    start = time.perf_counter()
+    # 스크레이퍼의 오류 출력은 결과 집계로 대신함
+    with contextlib.redirect_stdout(io.StringIO()), ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(lambda arg: timed_call(func, arg), args_list))
+    elapsed = time.perf_counter() - start
+
+    latencies = np.array([latency for latency, _ in results]) * 1000
+    errors = sum(1 for _, result in results if result is None)
+    return {
+        "endpoint": name,
+        "requests": len(results),
+        "errors": errors,
+        "error_rate": errors / len(results) if results else 0.0,
+        "throughput": len(results) / elapsed if elapsed > 0 else 0.0,
+        "p50_ms": float(np.percentile(latencies, 50)) if results else 0.0,
+        "p95_ms": float(np.percentile(latencies, 95)) if results else 0.0,
+        "p99_ms": float(np.percentile(latencies, 99)) if results else 0.0,
+        "max_ms": float(latencies.max()) if results else 0.0,
+    }
+
+
+def fetch_appids(fetcher: SteamDataFetcher, rankings: List[List[Dict]]) -> List[int]:
+    """Appids from a successful timed round, retrying outside the measurement if every round failed"""
+    for _ in range(SETUP_RETRIES if not rankings else 0):
+        with contextlib.redirect_stdout(io.StringIO()):
+            top_games = fetcher.get_top_100_games()
+        if top_games:
+            rankings.append(top_games)
+            break
+    return [game["appid"] for game in rankings[0]] if rankings else []
+
+
+def print_report(reports: List[Dict]):
+    print(f"{'endpoint':<28}{'reqs':>7}{'errors':>8}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    for r in reports:
+        print(f"{r['endpoint']:<28}{r['requests']:>7}{r['errors']:>8}{r['throughput']:>10.1f}"
+              f"{r['p50_ms']:>10.1f}{r['p95_ms']:>10.1f}{r['p99_ms']:>10.1f}{r['max_ms']:>10.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scraper load test against the mock Steam API")
+    parser.add_argument("--base-url", help="Use an already running mock server instead of starting one")
+    parser.add_argument("--rounds", type=int, default=3, help="Snapshots to simulate")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--max-error-rate", type=float, default=1.0, help="Exit non-zero above this overall error rate")
+    add_server_arguments(parser)
+    args = parser.parse_args()
+
+    server = None
+    base_url = args.base_url
+    if base_url is None:
+        fixtures, config = build_from_args(args)
+        server = start_in_background(fixtures, config)
+        base_url = server_url(server)
+    print(f"Load testing scrapers against {base_url}")
+
+    fetcher = SteamDataFetcher(STEAM_API_KEY, base_url=base_url)
+    metadata_fetcher = SteamGameMetadata(base_url=f"{base_url}/api/appdetails")
+
+    try:
+        rankings = []
+
+        def fetch_rankings(_):
+            top_games = fetcher.get_top_100_games()
+            if top_games:
+                rankings.append(top_games)
+            return top_games or None
+
+        reports = [run_endpoint("GetMostPlayedGames", fetch_rankings, range(args.rounds), args.concurrency)]
+        appids = fetch_appids(fetcher, rankings)
+        if not appids:
+            print(f"Failed to fetch top 100 games from the mock server after {SETUP_RETRIES} retries.")
+            sys.exit(1)
+        reports.append(run_endpoint("GetNumberOfCurrentPlayers", fetcher.get_current_players,
+                                    appids * args.rounds, args.concurrency))
+        reports.append(run_endpoint("appdetails", metadata_fetcher.get_game_details,
+                                    appids, args.concurrency))
+    finally:
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+
+    print_report(reports)
+    total = sum(r["requests"] for r in reports)
+    error_rate = sum(r["errors"] for r in reports) / total if total else 0.0
+    print(f"Overall error rate: {error_rate:.2%}")
+    if error_rate > args.max_error_rate:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,269 @@
+"""
+Local stand-in for the Steam endpoints used by the scrapers.
+
+Serves GetMostPlayedGames, GetNumberOfCurrentPlayers and appdetails from
+recorded (data/raw) or synthetic fixtures, with configurable latency,
+error rate and 429 throttling.
+
+    python mock_steam_server.py --port 8765 --latency-ms 50 --error-rate 0.01 --rate-limit 200
+    STEAM_API_BASE_URL=http://127.0.0.1:8765 \
+    STEAM_STORE_API_URL=http://127.0.0.1:8765/api/appdetails python fetch_realtime_top100.py
+"""
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+SYNTHETIC_GENRES = ["Action", "Adventure", "RPG", "Strategy", "Simulation", "Casual", "Indie", "Sports", "Racing", "Free to Play"]
+SYNTHETIC_CATEGORIES = ["Single-player", "Multi-player", "Online PvP", "Co-op", "Steam Achievements", "Steam Cloud", "Full controller support", "Steam Trading Cards"]
+
+
+class MockSteamConfig:
+    def __init__(self, latency_ms: float = 0.0, latency_jitter_ms: float = 0.0, error_rate: float = 0.0,
+                 throttle_rate: float = 0.0, rate_limit: float = 0.0, seed: Optional[int] = None,
+                 include_concurrent: bool = False):
+        self.latency_ms = latency_ms
+        self.latency_jitter_ms = latency_jitter_ms
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        # 초당 허용 요청 수 (0이면 제한 없음), 초과 시 429 반환
+        self.rate_limit = rate_limit
+        self.random = random.Random(seed)
+        # 실제 GetMostPlayedGames 랭크에는 동접자 수가 없으므로 기본적으로 생략
+        self.include_concurrent = include_concurrent
+
+
+class TokenBucket:
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.tokens = rate
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def take(self) -> bool:
+        """Take one token, returning False when the bucket is empty"""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return True
+            return False
+
+
+class MockSteamFixtures:
+    def __init__(self, top_games: List[Dict], metadata: Dict):
+        self.top_games = top_games
+        self.metadata = {str(appid): meta for appid, meta in metadata.items()}
+        self.players = {int(game["appid"]): int(game.get("current_players") or 0) for game in top_games}
+
+    @classmethod
+    def synthetic(cls, count: int = 100, seed: int = 0) -> "MockSteamFixtures":
+        """Generate deterministic synthetic fixtures"""
+        rng = random.Random(seed)
+        top_games = []
+        metadata = {}
+        for rank in range(1, count + 1):
+            appid = 10 * rank + rng.randint(0, 9)
+            current_players = int(1_000_000 / rank) + rng.randint(0, 1000)
+            top_games.append({
+                "rank": rank,
+                "appid": appid,
+                "last_week_rank": max(1, rank + rng.randint(-3, 3)),
+                "peak_in_game": int(current_players * rng.uniform(1.0, 1.5)),
+                "current_players": current_players,
+            })
+            metadata[str(appid)] = {
+                "name": f"Synthetic Game {appid}",
+                "genres": rng.sample(SYNTHETIC_GENRES, rng.randint(1, 3)),
+                "categories": rng.sample(SYNTHETIC_CATEGORIES, rng.randint(1, 4)),
+                "release_date": f"{rng.randint(2005, 2025)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+                "price": rng.choice([0.0, 9.99, 19.99, 29.99, 59.99]),
+                "short_description": f"Synthetic fixture for app {appid}.",
+                "header_image": f"https://cdn.akamai.steamstatic.com/steam/apps/{appid}/header.jpg",
+            }
+        return cls(top_games, metadata)
+
+    @classmethod
+    def from_files(cls, top100_path: str, metadata_path: Optional[str] = None) -> "MockSteamFixtures":
+        """Load recorded fixtures saved by the scrapers"""
+        with open(top100_path, "r", encoding="utf-8") as f:
+            top_games = json.load(f)
+        metadata = {}
+        if metadata_path:
+            with open(metadata_path, "r", encoding="utf-8") as f:
+                metadata = json.load(f)
+        return cls(top_games, metadata)
+
+    def ranks(self, limit: int, include_concurrent: bool = False) -> List[Dict]:
+        ranks = []
+        for game in self.top_games[:limit]:
+            rank = {
+                "rank": game["rank"],
+                "appid": game["appid"],
+                "last_week_rank": game.get("last_week_rank", game["rank"]),
+                "peak_in_game": game.get("peak_in_game", 0),
+            }
+            if include_concurrent and game.get("current_players") is not None:
+                rank["concurrent_in_game"] = game["current_players"]
+            ranks.append(rank)
+        return ranks
+
+    def app_details(self, appid: str) -> Optional[Dict]:
+        """Convert a saved metadata record back into the appdetails payload shape"""
+        meta = self.metadata.get(appid)
+        if meta is None:
+            return None
+        details = {
+            "type": "game",
+            "name": meta.get("name", "Unknown"),
+            "steam_appid": int(appid),
+            "short_description": meta.get("short_description", ""),
+            "header_image": meta.get("header_image", ""),
+            "genres": [{"id": str(i), "description": g} for i, g in enumerate(meta.get("genres", []), 1)],
+            "categories": [{"id": i, "description": c} for i, c in enumerate(meta.get("categories", []), 1)],
+            "release_date": {"coming_soon": False, "date": meta.get("release_date", "Unknown")},
+        }
+        if meta.get("price"):
+            details["price_overview"] = {"currency": "USD", "final": int(round(meta["price"] * 100))}
+        return details
+
+
+class MockSteamHandler(BaseHTTPRequestHandler):
+    fixtures: MockSteamFixtures = None
+    config: MockSteamConfig = None
+    bucket: Optional[TokenBucket] = None
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        params = {key: values[0] for key, values in parse_qs(parsed.query).items()}
+        config = self.config
+
+        if config.latency_ms or config.latency_jitter_ms:
+            delay = config.latency_ms + config.random.uniform(-config.latency_jitter_ms, config.latency_jitter_ms)
+            time.sleep(max(0.0, delay) / 1000)
+
+        if (self.bucket is not None and not self.bucket.take()) or config.random.random() < config.throttle_rate:
+            self._send(429, {"error": "Too Many Requests"}, {"Retry-After": "1"})
+            return
+        if config.random.random() < config.error_rate:
+            self._send(500, {"error": "Internal Server Error"})
+            return
+
+        path = parsed.path.rstrip("/")
+        if path == "/ISteamChartsService/GetMostPlayedGames/v1":
+            limit = int(params.get("limit", 100))
+            self._send(200, {"response": {"rollup_date": int(time.time()), "ranks": self.fixtures.ranks(limit, config.include_concurrent)}})
+        elif path == "/ISteamUserStats/GetNumberOfCurrentPlayers/v1":
+            appid = int(params.get("appid", 0))
+            if appid in self.fixtures.players:
+                self._send(200, {"response": {"player_count": self.fixtures.players[appid], "result": 1}})
+            else:
+                self._send(404, {"response": {"result": 42}})
+        elif path == "/api/appdetails":
+            appid = params.get("appids", "")
+            details = self.fixtures.app_details(appid)
+            payload = {"success": True, "data": details} if details else {"success": False}
+            self._send(200, {appid: payload})
+        else:
+            self._send(404, {"error": "Not Found"})
+
+    def _send(self, status: int, payload: Dict, headers: Optional[Dict] = None):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # 부하 테스트 중 요청 로그가 출력을 덮지 않도록 무시
+        pass
+
+
+class MockSteamServer(ThreadingHTTPServer):
+    # 기본 listen backlog(5)는 동시 연결이 많으면 넘쳐 SYN 재전송(~1초) 지연이 측정에 섞임
+    request_queue_size = 1024
+    daemon_threads = True
+
+
+def create_server(fixtures: MockSteamFixtures, config: MockSteamConfig,
+                  host: str = "127.0.0.1", port: int = 0) -> MockSteamServer:
+    """Create a threaded mock server; port 0 picks a free port"""
+    handler = type("BoundMockSteamHandler", (MockSteamHandler,), {
+        "fixtures": fixtures,
+        "config": config,
+        "bucket": TokenBucket(config.rate_limit) if config.rate_limit > 0 else None,
+    })
+    return MockSteamServer((host, port), handler)
+
+
+def start_in_background(fixtures: MockSteamFixtures, config: MockSteamConfig,
+                        host: str = "127.0.0.1", port: int = 0) -> MockSteamServer:
+    """Start the mock server on a daemon thread and return it"""
+    server = create_server(fixtures, config, host, port)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def server_url(server: MockSteamServer) -> str:
+    host, port = server.server_address[:2]
+    return f"http://{host}:{port}"
+
+
+def add_server_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument("--top100", help="Recorded top100_games_*.json fixture (default: synthetic)")
+    parser.add_argument("--metadata", help="Recorded game_metadata_*.json fixture")
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--latency-jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with 500")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Fraction of requests answered with 429")
+    parser.add_argument("--rate-limit", type=float, default=0.0, help="Requests per second before 429 (0 = unlimited)")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--include-concurrent", action="store_true",
+                        help="Add concurrent_in_game to ranks (the real endpoint omits it)")
+
+
+def build_from_args(args) -> Tuple[MockSteamFixtures, MockSteamConfig]:
+    if args.top100:
+        fixtures = MockSteamFixtures.from_files(args.top100, args.metadata)
+    else:
+        fixtures = MockSteamFixtures.synthetic(seed=args.seed or 0)
+    config = MockSteamConfig(
+        latency_ms=args.latency_ms,
+        latency_jitter_ms=args.latency_jitter_ms,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        rate_limit=args.rate_limit,
+        include_concurrent=args.include_concurrent,
+        seed=args.seed,
+    )
+    return fixtures, config
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local Steam API stand-in server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    add_server_arguments(parser)
+    args = parser.parse_args()
+
+    fixtures, config = build_from_args(args)
+    server = create_server(fixtures, config, args.host, args.port)
+    print(f"Mock Steam API listening on {server_url(server)}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Opt-in cProfile hooks for dashboard reruns and scraper runs.
+
+Set STEAM_ANALYTICS_PROFILE=1 (or open the dashboard with ?profile=1) to save
+one pstats file per run under data/profiles, keeping the newest
+STEAM_ANALYTICS_PROFILE_KEEP files per run name. When disabled the hook is a
+single environment lookup.
+
+    python -m pstats data/profiles/dashboard_20250617_093209_123456.pstats
+    snakeviz data/profiles/dashboard_20250617_093209_123456.pstats   # flamegraph-style view
+"""
+import cProfile
+import os
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+PROFILE_ENV = "STEAM_ANALYTICS_PROFILE"
+PROFILE_DIR = Path(os.environ.get(
+    "STEAM_ANALYTICS_PROFILE_DIR", Path(__file__).parent.parent.parent / "data" / "profiles"
+))
+PROFILE_KEEP = int(os.environ.get("STEAM_ANALYTICS_PROFILE_KEEP", 50))
+
+
+def profiling_enabled() -> bool:
+    return os.environ.get(PROFILE_ENV, "").lower() in ("1", "true", "yes")
+
+
+def prune_profiles(name: str, keep: int = PROFILE_KEEP):
+    """Delete the oldest saved profiles for a run name beyond `keep`"""
+    files = sorted(PROFILE_DIR.glob(f"{name}_*.pstats"))
+    for path in files[:max(len(files) - keep, 0)]:
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+
+@contextmanager
+def profile_run(name: str, enabled: Optional[bool] = None):
+    """Profile the wrapped block and save a timestamped pstats file if enabled"""
+    if enabled is None:
+        enabled = profiling_enabled()
+    if not enabled:
+        yield
+        return
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        # Streamlit의 rerun/stop 예외로 중단되어도 프로파일은 저장
+        profiler.disable()
+        try:
+            PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+            profiler.dump_stats(str(PROFILE_DIR / f"{name}_{timestamp}.pstats"))
+            prune_profiles(name)
+        except OSError as e:
+            print(f"Error saving profile for {name}: {str(e)}")
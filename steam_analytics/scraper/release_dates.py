@@ -0,0 +1,84 @@
+"""
+Normalize Steam release date strings ("Jun 17, 2025", "17 Jun, 2025",
+"2025-06-17", "2025년 6월 17일", "17. Juni 2025", ...) into ISO dates.
+
+Results are cached per raw string, so repeated and unparseable values
+("Coming soon", "To be announced") are only looked at once.
+"""
+import re
+from datetime import date
+from functools import lru_cache
+from typing import Optional
+
+MONTHS = {
+    # English
+    "jan": 1, "january": 1, "feb": 2, "february": 2, "mar": 3, "march": 3, "apr": 4, "april": 4,
+    "may": 5, "jun": 6, "june": 6, "jul": 7, "july": 7, "aug": 8, "august": 8,
+    "sep": 9, "sept": 9, "september": 9, "oct": 10, "october": 10, "nov": 11, "november": 11,
+    "dec": 12, "december": 12,
+    # German
+    "januar": 1, "februar": 2, "mär": 3, "märz": 3, "mai": 5, "juni": 6, "juli": 7,
+    "okt": 10, "oktober": 10, "dez": 12, "dezember": 12,
+    # French
+    "janv": 1, "janvier": 1, "févr": 2, "février": 2, "mars": 3, "avr": 4, "avril": 4,
+    "juin": 6, "juil": 7, "juillet": 7, "août": 8, "septembre": 9, "octobre": 10,
+    "novembre": 11, "déc": 12, "décembre": 12,
+    # Spanish
+    "ene": 1, "enero": 1, "febrero": 2, "marzo": 3, "abr": 4, "abril": 4, "mayo": 5,
+    "junio": 6, "julio": 7, "ago": 8, "agosto": 8, "septiembre": 9, "octubre": 10,
+    "noviembre": 11, "dic": 12, "diciembre": 12,
+}
+
+ISO_PATTERN = re.compile(r"^(\d{4})[-./](\d{1,2})[-./](\d{1,2})")
+CJK_PATTERN = re.compile(r"(\d{4})\s*[년年]\s*(\d{1,2})\s*[월月](?:\s*(\d{1,2})\s*[일日])?")
+DAY_FIRST_PATTERN = re.compile(r"^(\d{1,2})[./](\d{1,2})[./](\d{4})$")
+TOKEN_PATTERN = re.compile(r"[^\W\d_]+|\d+")
+
+
+def _safe_date(year: int, month: int, day: int) -> Optional[date]:
+    try:
+        return date(year, month, day)
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=8192)
+def parse_release_date(text) -> Optional[date]:
+    """Parse a Steam release date; missing day/month default to the 1st"""
+    if not text or not isinstance(text, str):
+        return None
+    text = text.strip()
+
+    match = ISO_PATTERN.match(text)
+    if match:
+        return _safe_date(int(match.group(1)), int(match.group(2)), int(match.group(3)))
+    match = CJK_PATTERN.search(text)
+    if match:
+        return _safe_date(int(match.group(1)), int(match.group(2)), int(match.group(3) or 1))
+    match = DAY_FIRST_PATTERN.match(text)
+    if match:
+        return _safe_date(int(match.group(3)), int(match.group(2)), int(match.group(1)))
+
+    # 월 이름이 들어간 형식: 토큰에서 연도(4자리), 일(1~2자리), 월 이름을 찾음
+    year = month = day = None
+    for token in TOKEN_PATTERN.findall(text.lower()):
+        if token.isdigit():
+            if len(token) == 4 and year is None:
+                year = int(token)
+            elif len(token) <= 2 and day is None:
+                day = int(token)
+        elif month is None:
+            # 목록에 있는 이름만 인정 ("juil."의 마침표는 토큰에서 제외됨, "Marvel"은 월이 아님)
+            month = MONTHS.get(token)
+    if year is None:
+        return None
+    if month is None:
+        # "2025"처럼 연도만 있는 경우 (분기 등 나머지 정보는 무시)
+        return _safe_date(year, 1, 1) if text.strip() == str(year) else None
+    return _safe_date(year, month, day or 1)
+
+
+def normalize_release_date(text) -> Optional[str]:
+    """ISO string form of parse_release_date for JSON storage"""
+    parsed = parse_release_date(text)
+    return parsed.isoformat() if parsed else None